@@ -6,9 +6,13 @@ from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
 
 
+# Resolve the credential chain once; signing reuses the frozen copy
+# instead of re-resolving per request.
+_credentials = boto3.Session().get_credentials().get_frozen_credentials()
+
+
 def sign_request(req, service, region):
-    session = boto3.Session()
-    credentials = session.get_credentials().get_frozen_credentials()
+    credentials = _credentials
 
     # Convert requests.PreparedRequest to AWSRequest
     aws_req = AWSRequest(
@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 
-from random import randint
 from amazon_image_gen import BedrockImageGenerator
+import common
 import file_utils
 import logging
-from datetime import datetime
 
-logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
 
 def main():
+    # Create a unique output directory and random seed for this run.
+    output_directory, seed = common.new_run()
+
     # Configure the inference parameters.
     inference_params = {
         "taskType": "TEXT_IMAGE",
@@ -24,14 +25,10 @@ def main():
             "width": 1280,  # See README for supported output resolutions
             "height": 720,  # See README for supported output resolutions
             "cfgScale": 7.0,  # How closely the prompt will be followed
-            "seed": randint(0, 858993459),  # Use a random seed
+            "seed": seed,  # Use a random seed
         },
     }
 
-    # Define an output directory with a unique name.
-    generation_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_directory = f"output/{generation_id}"
-
     # Create the generator.
     generator = BedrockImageGenerator(output_directory=output_directory)
 
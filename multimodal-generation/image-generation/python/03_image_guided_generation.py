@@ -1,22 +1,21 @@
 #!/usr/bin/env python3
 
-from random import randint
 from amazon_image_gen import BedrockImageGenerator
+import common
 import file_utils
 import logging
-import base64
-from datetime import datetime
 
-logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
 
 def main():
+    # Create a unique output directory and random seed for this run.
+    output_directory, seed = common.new_run()
+
     conditioning_image_path = "../images/condition-image-1.png"
 
     # Read image from file and encode it as base64 string.
-    with open(conditioning_image_path, "rb") as image_file:
-        condition_image = base64.b64encode(image_file.read()).decode("utf8")
+    condition_image = file_utils.load_image_b64(conditioning_image_path)
 
     # Configure the inference parameters.
     inference_params = {
@@ -33,14 +32,10 @@ def main():
             "width": 1280,  # See README for supported output resolutions
             "height": 720,  # See README for supported output resolutions
             "cfgScale": 8.0,  # How closely the prompt will be followed
-            "seed": randint(0, 858993459),  # Use a random seed
+            "seed": seed,  # Use a random seed
         },
     }
 
-    # Define an output directory with a unique name.
-    generation_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_directory = f"output/{generation_id}"
-
     # Create the generator.
     generator = BedrockImageGenerator(output_directory=output_directory)
 
@@ -1,28 +1,33 @@
 #!/usr/bin/env python3
 
-from random import randint
+from concurrent.futures import ThreadPoolExecutor
 from amazon_image_gen import BedrockImageGenerator
+import common
 import file_utils
 import logging
-import base64
-from datetime import datetime
 
-logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
 
 def main():
+    # Create a unique output directory and random seed for this run.
+    output_directory, seed = common.new_run()
+
     reference_image_paths = [
         "../images/redhair-boy-1.png",
         "../images/redhair-boy-2.png",
         "../images/redhair-boy-3.png",
     ]
 
-    # Load all reference images as base64.
-    images = []
-    for path in reference_image_paths:
-        with open(path, "rb") as image_file:
-            images.append(base64.b64encode(image_file.read()).decode("utf-8"))
+    # Load all reference images as base64 in parallel. The file reads and the
+    # C-level encoder both release the GIL, so the encodes overlap and the
+    # preprocessing takes as long as the largest image instead of the sum.
+    # Oversized references are downscaled before encoding since the service
+    # resamples them anyway.
+    with ThreadPoolExecutor(max_workers=len(reference_image_paths)) as executor:
+        images = list(
+            executor.map(file_utils.load_image_b64_resized, reference_image_paths)
+        )
 
     # Configure the inference parameters.
     inference_params = {
@@ -39,14 +44,10 @@ def main():
             "width": 1280,  # See README for supported output resolutions
             "height": 720,  # See README for supported output resolutions
             "cfgScale": 4.0,  # How closely the prompt will be followed
-            "seed": randint(0, 858993459),  # Use a random seed
+            "seed": seed,  # Use a random seed
         },
     }
 
-    # Define an output directory with a unique name.
-    generation_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_directory = f"output/{generation_id}"
-
     # Create the generator.
     generator = BedrockImageGenerator(
         output_directory=output_directory
@@ -1,17 +1,18 @@
 #!/usr/bin/env python3
 
-from random import randint
+from concurrent.futures import ThreadPoolExecutor
 from amazon_image_gen import BedrockImageGenerator
+import common
 import file_utils
 import logging
-import base64
-from datetime import datetime
 
-logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
 
 def main():
+    # Create a unique output directory and random seed for this run.
+    output_directory, seed = common.new_run()
+
     # Set the image to be edited.
     source_image = "../images/three_pots.jpg"
 
@@ -19,12 +20,11 @@ def main():
     # black and pure white pixels.
     mask_image = "../images/three_pots-center_pot_mask.png"
 
-    # Load the source image from disk.
-    with open(source_image, "rb") as image_file:
-        source_image_base64 = base64.b64encode(image_file.read()).decode("utf-8")
-
-    with open(mask_image, "rb") as mask_file:
-        mask_image_base64 = base64.b64encode(mask_file.read()).decode("utf-8")
+    # Load the source and mask images from disk, encoding them in parallel.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_image_base64, mask_image_base64 = executor.map(
+            file_utils.load_image_b64_cached, [source_image, mask_image]
+        )
 
     # Configure the inference parameters.
     inference_params = {
@@ -39,14 +39,10 @@ def main():
             "numberOfImages": 1,  # Number of variations to generate. 1 to 5.
             "quality": "standard",  # Allowed values are "standard" and "premium"
             "cfgScale": 7.0,  # How closely the prompt will be followed
-            "seed": randint(0, 858993459),  # Use a random seed
+            "seed": seed,  # Use a random seed
         },
     }
 
-    # Define an output directory with a unique name.
-    generation_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_directory = f"output/{generation_id}"
-
     # Create the generator.
     generator = BedrockImageGenerator(
         output_directory=output_directory
@@ -1,22 +1,22 @@
 #!/usr/bin/env python3
 
 from amazon_image_gen import BedrockImageGenerator
+import common
 import file_utils
 import logging
-import base64
-from datetime import datetime
 
-logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
 
 def main():
+    # Create a unique output directory and random seed for this run.
+    output_directory, _ = common.new_run()
+
     # The image to be edited.
     source_image_path = "../images/man-in-orange.png"
 
     # Read image from disk.
-    with open(source_image_path, "rb") as image_file:
-        source_image_base64 = base64.b64encode(image_file.read()).decode("utf8")
+    source_image_base64 = file_utils.load_image_b64(source_image_path)
 
     # Configure the inference parameters.
     inference_params = {
@@ -26,10 +26,6 @@ def main():
         },
     }
 
-    # Define an output directory with a unique name.
-    generation_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_directory = f"output/{generation_id}"
-
     # Create the generator.
     generator = BedrockImageGenerator(
         output_directory=output_directory
@@ -1,30 +1,29 @@
 #!/usr/bin/env python3
 
-from random import randint
+from concurrent.futures import ThreadPoolExecutor
 from amazon_image_gen import BedrockImageGenerator
+import common
 import file_utils
 import logging
-import base64
-from datetime import datetime
 
-logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
 
 def main():
+    # Create a unique output directory and random seed for this run.
+    output_directory, seed = common.new_run()
+
     # The image to be edited.
     source_image_path = "../images/three_pots.jpg"
 
     # IMPORTANT: The mask must be in PNG format and must contain only pure black and pure white pixels.
     mask_image_path = "../images/three_pots-add_mask.png"
 
-    # Load the input image from disk.
-    with open(source_image_path, "rb") as image_file:
-        source_image_base64 = base64.b64encode(image_file.read()).decode("utf-8")
-
-    # Load the mask image from disk.
-    with open(mask_image_path, "rb") as mask_file:
-        mask_image_base64 = base64.b64encode(mask_file.read()).decode("utf-8")
+    # Load the input and mask images from disk, encoding them in parallel.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_image_base64, mask_image_base64 = executor.map(
+            file_utils.load_image_b64_cached, [source_image_path, mask_image_path]
+        )
 
     # Configure the inference parameters.
     inference_params = {
@@ -38,14 +37,10 @@ def main():
             "numberOfImages": 1,  # Number of variations to generate. 1 to 5.
             "quality": "standard",  # Allowed values are "standard" and "premium"
             "cfgScale": 6.0,  # How closely the prompt will be followed
-            "seed": randint(0, 858993459),  # Use a random seed
+            "seed": seed,  # Use a random seed
         },
     }
 
-    # Define an output directory with a unique name.
-    generation_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_directory = f"output/{generation_id}"
-
     # Create the generator.
     generator = BedrockImageGenerator(
         output_directory=output_directory
@@ -1,16 +1,50 @@
 from typing import Dict, Any
-import json
+import copy
+import functools
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from secrets import randbits
 import boto3
+import orjson
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 from boto3.session import Session
 
 logger = logging.getLogger(__name__)
 # boto has a default timeout of 60 seconds which can be
-# surpassed when generating multiple images.
-config = Config(read_timeout=300)
+# surpassed when generating multiple images. Keep-alive and a larger
+# connection pool let looping or fanned-out callers reuse the TLS
+# connection instead of re-handshaking per request.
+config = Config(
+    read_timeout=300,
+    max_pool_connections=16,
+    tcp_keepalive=True,
+    retries={"mode": "standard", "max_attempts": 3},
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(region_name: str) -> boto3.client:
+    """Return a cached Bedrock runtime client for the given region.
+
+    Constructing a client resolves the credential provider chain and loads
+    endpoint and model data, which costs hundreds of milliseconds. Clients
+    are thread-safe and reusable, so one per region per process is enough.
+
+    Args:
+        region_name (str): AWS region to create the client in.
+
+    Returns:
+        boto3.client: A shared Bedrock runtime client for the region.
+    """
+    return Session().client(
+        service_name="bedrock-runtime",
+        region_name=region_name,
+        config=config,
+    )
 
 
 class ImageGenerationError(Exception):
@@ -73,30 +107,47 @@ class BedrockImageGenerator:
             ImageGenerationError: If client initialization fails due to AWS service errors.
         """
         try:
-            session = Session()
-            return session.client(
-                service_name="bedrock-runtime",
-                region_name=self.region_name,
-                config=config
-            )
+            return _get_client(self.region_name)
         except (BotoCoreError, ClientError) as e:
             logger.error(f"Failed to initialize Bedrock client: {str(e)}")
             raise ImageGenerationError("Failed to initialize AWS Bedrock client") from e
 
-    def _save_json_to_file(self, data: Dict[str, Any], filename: str) -> None:
+    def _save_json_to_file(
+        self, data: Dict[str, Any], filename: str, pretty: bool = False
+    ) -> None:
         """Save JSON data to a file in the output directory.
 
         Args:
             data (Dict[str, Any]): Dictionary containing JSON-serializable data.
             filename (str): Name of the file to save the data to.
+            pretty (bool): Whether to indent the output. Defaults to False;
+                indentation only pays off for small human-readable files.
 
         Raises:
             ImageGenerationError: If saving the file fails.
         """
         try:
             filepath = self.output_directory / filename
-            with filepath.open("w") as f:
-                json.dump(data, f, indent=2)
+            filepath.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+            )
+        except IOError as e:
+            logger.error(f"Failed to save {filename}: {str(e)}")
+            raise ImageGenerationError(f"Failed to save {filename}") from e
+
+    def _write_bytes(self, data: bytes, filename: str) -> None:
+        """Write already-serialized bytes to a file in the output directory.
+
+        Args:
+            data (bytes): The content to write.
+            filename (str): Name of the file to save the content to.
+
+        Raises:
+            ImageGenerationError: If saving the file fails.
+        """
+        try:
+            filepath = self.output_directory / filename
+            filepath.write_bytes(data)
         except IOError as e:
             logger.error(f"Failed to save {filename}: {str(e)}")
             raise ImageGenerationError(f"Failed to save {filename}") from e
@@ -165,9 +216,28 @@ class BedrockImageGenerator:
 
             self._log_generation_details(inference_params, model_id)
 
-            # Prepare and save request
-            body_json = json.dumps(inference_params, indent=2)
-            self._save_json_to_file(json.loads(body_json), "request.json")
+            # Prepare and save request. orjson serializes large base64-bearing
+            # payloads several times faster than stdlib json and emits UTF-8
+            # bytes directly, which is what the HTTP layer wants anyway.
+            body_json = orjson.dumps(inference_params)
+
+            # The request/response mirror files are diagnostic, not
+            # functional; writing megabytes per call to disk is only worth it
+            # when someone is actually debugging.
+            debug = bool(os.environ.get("BEDROCK_IMAGE_DEBUG"))
+            # Each call gets its own mirror filenames: concurrent requests
+            # (see generate_images_parallel) would otherwise interleave
+            # writes into shared request.json/response_body.json files.
+            debug_tag = f"{randbits(32):08x}"
+            if debug:
+                # Write asynchronously so disk I/O overlaps the API call.
+                # The mirror is written as-is — re-parsing a request that can
+                # carry megabytes of base64 just to re-serialize it is waste.
+                threading.Thread(
+                    target=self._write_bytes,
+                    args=(body_json, f"request_{debug_tag}.json"),
+                    daemon=True,
+                ).start()
 
             # Make the API call
             response = self.bedrock_client.invoke_model(
@@ -177,14 +247,24 @@ class BedrockImageGenerator:
                 contentType="application/json",
             )
 
-            # Save response metadata
-            self._save_json_to_file(
-                response.get("ResponseMetadata", {}), "response_metadata.json"
-            )
-
-            # Process and save response body
-            response_body = json.loads(response.get("body").read())
-            self._save_json_to_file(response_body, "response_body.json")
+            # Always parse the body from memory; the debug mirrors are
+            # written afterwards from the same bytes, so a slow or failed
+            # disk write can never corrupt what the caller receives.
+            raw_body = response.get("body").read()
+            response_body = orjson.loads(raw_body)
+
+            if debug:
+                # Save response metadata
+                self._save_json_to_file(
+                    response.get("ResponseMetadata", {}),
+                    f"response_metadata_{debug_tag}.json",
+                    pretty=True,
+                )
+                threading.Thread(
+                    target=self._write_bytes,
+                    args=(raw_body, f"response_body_{debug_tag}.json"),
+                    daemon=True,
+                ).start()
 
             # Log request ID for tracking
             request_id = response.get("ResponseMetadata", {}).get("RequestId")
@@ -205,7 +285,7 @@ class BedrockImageGenerator:
         except (BotoCoreError, ClientError) as e:
             logger.error(f"AWS service error: {str(e)}")
             if hasattr(e, "response"):
-                self._save_json_to_file(e.response, "error_response.json")
+                self._save_json_to_file(e.response, "error_response.json", pretty=True)
             raise ImageGenerationError(
                 "Failed to generate images: AWS service error"
             ) from e
@@ -215,3 +295,54 @@ class BedrockImageGenerator:
             raise ImageGenerationError(
                 "Unexpected error during image generation"
             ) from e
+
+    def generate_images_parallel(
+        self,
+        inference_params: Dict[str, Any],
+        model_id: str = DEFAULT_MODEL_ID,
+        concurrency: int = 5,
+    ) -> Dict[str, Any]:
+        """Generate multiple image variations with concurrent requests.
+
+        The service generates the variations within a single invoke_model
+        call sequentially, so a request for N images pays roughly N times the
+        latency of one. This method splits the request into N single-image
+        calls with distinct seeds and runs them on a thread pool, reducing
+        wall-clock time up to the account's concurrency limit.
+
+        Args:
+            inference_params (Dict[str, Any]): Image generation parameters.
+                The numberOfImages field determines the fan-out; seeds are
+                re-randomized per request so variations differ.
+            model_id (str): The model ID to use for generation. Defaults to DEFAULT_MODEL_ID.
+            concurrency (int): Maximum number of in-flight requests. Defaults to 5.
+
+        Returns:
+            Dict[str, Any]: The response of the first request, with the
+                "images" lists of all responses merged in request order.
+
+        Raises:
+            ImageGenerationError: If any of the underlying requests fail.
+        """
+        image_count = self._get_image_count(inference_params)
+        if image_count <= 1:
+            return self.generate_images(inference_params, model_id)
+
+        requests = []
+        for _ in range(image_count):
+            params = copy.deepcopy(inference_params)
+            generation_config = params.setdefault("imageGenerationConfig", {})
+            generation_config["numberOfImages"] = 1
+            generation_config["seed"] = randbits(30) % 858993460
+            requests.append(params)
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, image_count)) as executor:
+            responses = list(
+                executor.map(lambda params: self.generate_images(params, model_id), requests)
+            )
+
+        merged = dict(responses[0])
+        merged["images"] = [
+            image for response in responses for image in response.get("images", [])
+        ]
+        return merged
@@ -0,0 +1,36 @@
+"""Shared setup for the example scripts.
+
+Every script needs the same scaffolding: logging configuration, a uniquely
+named output directory, and a random seed. Centralizing it here keeps the
+scripts focused on their inference parameters and saves re-doing the setup
+in each one.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from secrets import randbits
+
+logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+# Highest seed value accepted by the imageGenerationConfig "seed" field.
+MAX_SEED = 858993459
+
+
+def new_run():
+    """
+    Prepares a new generation run.
+
+    Creates a uniquely named output directory under "output/" and draws a
+    random seed suitable for the imageGenerationConfig "seed" field.
+
+    Returns:
+        tuple: The output directory as a pathlib.Path (created if needed)
+        and the random seed as an int.
+    """
+    generation_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    output_directory = Path("output") / generation_id
+    output_directory.mkdir(parents=True, exist_ok=True)
+    # secrets draws straight from the OS entropy pool, skipping the Mersenne
+    # Twister state initialization the random module pays on first use.
+    return output_directory, randbits(30) % (MAX_SEED + 1)
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 
+import asyncio
 import boto3
+import aioboto3
+import httpx
 import logging
-import json
-import random
+import orjson
+import time
 import amazon_video_util
+from collections import defaultdict
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
 from datetime import datetime, timedelta, timezone
 
 # Configure logging
@@ -14,58 +20,98 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_MODEL_ID = "amazon.nova-reel-v1:0"
 
-def setup_aws_session(region="us-east-1"):
-    """Set up AWS session with default region"""
+# Async session shared across calls; clients are created per request so
+# credentials refresh correctly while many submissions are in flight.
+session = None
+
+# Submissions go straight over HTTP with SigV4 signing rather than through
+# aiobotocore, which skips its per-call model resolution. One shared client
+# lets HTTP/2 multiplex many concurrent submissions on a single connection.
+_http_client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=100))
+_region = None
+_credentials = None
+
+# Retry budget for job submission, matching botocore's standard mode.
+_SUBMIT_MAX_ATTEMPTS = 3
+
+def setup_aws_session(region="us-east-1", s3_destination_bucket=None):
+    """Set up AWS session with default region and destination bucket"""
+    global session, _region, _credentials
     boto3.setup_default_session(region_name=region)
+    session = aioboto3.Session(region_name=region)
+    _region = region
+    _credentials = boto3.Session().get_credentials().get_frozen_credentials()
+    if s3_destination_bucket:
+        amazon_video_util.ensure_bucket(amazon_video_util.get_client("s3"), s3_destination_bucket)
+        # Route the bucket's ObjectCreated events to SQS so completion is
+        # detected by long-poll instead of repeated status polling.
+        amazon_video_util.setup_completion_notifications(s3_destination_bucket)
     logger.info("AWS SDK session defaults have been set.")
 
 
-def generate_video(s3_destination_bucket, video_prompt, model_id=DEFAULT_MODEL_ID):
+async def generate_video(s3_destination_bucket, video_prompt, model_id=DEFAULT_MODEL_ID):
     """
     Generate a video using the provided prompt.
-    
+
+    The network calls are issued asynchronously, so a caller can submit many
+    videos concurrently with asyncio.gather and pay roughly one round-trip
+    of latency for the whole batch instead of one per video.
+
     Args:
         s3_destination_bucket (str): The S3 bucket where the video will be stored
         video_prompt (str): Text prompt describing the desired video
     """
-    # Set up the S3 client
-    s3_client = boto3.client("s3")
-
-    # Create the S3 bucket
-    s3_client.create_bucket(Bucket=s3_destination_bucket)
-
-    # Create the Bedrock Runtime client
-    bedrock_runtime = boto3.client("bedrock-runtime")
-
-    model_input = {
-        "taskType": "TEXT_VIDEO",
-        "textToVideoParams": {
-            "text": video_prompt,
-        },
-        "videoGenerationConfig": {
-            "durationSeconds": 6,  # 6 is the only supported value currently
-            "fps": 24,  # 24 is the only supported value currently
-            "dimension": "1280x720",  # "1280x720" is the only supported value currently
-            "seed": random.randint(
-                0, 2147483648
-            ),  # A random seed guarantees we'll get a different result each time this code runs
-        },
-    }
+    model_input = amazon_video_util.build_model_input(video_prompt)
 
     try:
-        # Start the asynchronous video generation job
-        invocation = bedrock_runtime.start_async_invoke(
-            modelId=model_id,
-            modelInput=model_input,
-            outputDataConfig={"s3OutputDataConfig": {"s3Uri": f"s3://{s3_destination_bucket}"}},
+        # Start the asynchronous video generation job. The request is signed
+        # with SigV4 and POSTed directly to the async-invoke endpoint.
+        body = orjson.dumps(
+            {
+                "modelId": model_id,
+                "modelInput": model_input,
+                "outputDataConfig": {
+                    "s3OutputDataConfig": {"s3Uri": f"s3://{s3_destination_bucket}"}
+                },
+            }
         )
+        # Bypassing botocore also bypasses its automatic retries, so retry
+        # throttles (429), server errors (5xx), and transport failures here
+        # with exponential backoff. Each attempt is re-signed because SigV4
+        # signatures carry a timestamp.
+        for attempt in range(_SUBMIT_MAX_ATTEMPTS):
+            request = AWSRequest(
+                method="POST",
+                url=f"https://bedrock-runtime.{_region}.amazonaws.com/async-invoke",
+                data=body,
+                headers={"Content-Type": "application/json"},
+            )
+            SigV4Auth(_credentials, "bedrock", _region).add_auth(request)
+            try:
+                response = await _http_client.post(
+                    request.url, headers=dict(request.headers), content=request.data
+                )
+                if response.status_code != 429 and response.status_code < 500:
+                    response.raise_for_status()
+                    break
+                if attempt == _SUBMIT_MAX_ATTEMPTS - 1:
+                    response.raise_for_status()
+                logger.warning(
+                    f"Retryable status {response.status_code} from async-invoke, retrying..."
+                )
+            except httpx.TransportError as e:
+                if attempt == _SUBMIT_MAX_ATTEMPTS - 1:
+                    raise
+                logger.warning(f"Transport error submitting job, retrying: {e}")
+            await asyncio.sleep(min(2**attempt, 10))
+        invocation = response.json()
 
         # Store the invocation ARN
         invocation_arn = invocation["invocationArn"]
 
-        # Pretty print the response JSON
-        logger.info("\nResponse:")
-        logger.info(json.dumps(invocation, indent=2, default=str))
+        # Serialize the response only when the log level actually emits it
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response: %s", orjson.dumps(invocation, option=orjson.OPT_NON_STR_KEYS).decode())
 
         # Save the invocation details for later reference
         amazon_video_util.save_invocation_info(invocation, model_input)
@@ -76,35 +122,65 @@ def generate_video(s3_destination_bucket, video_prompt, model_id=DEFAULT_MODEL_I
         logger.error(e)
         return None
 
-def check_job_status(invocation_arn):
+# Terminal statuses never change, so once a job reports one every later
+# check is answered locally without an API call.
+_FINAL_STATUSES = {"Completed", "Failed", "Stopped"}
+_terminal_cache = {}
+
+async def check_job_status(invocation_arn):
     """Check status of a specific job using get_async_invoke()"""
-    bedrock_runtime = boto3.client("bedrock-runtime")
+    cached = _terminal_cache.get(invocation_arn)
+    if cached is not None:
+        return cached
+
     try:
-        response = bedrock_runtime.get_async_invoke(
-            invocationArn=invocation_arn
-        )
-        
+        async with session.client("bedrock-runtime") as bedrock_runtime:
+            response = await bedrock_runtime.get_async_invoke(
+                invocationArn=invocation_arn
+            )
+
         status = response["status"]
+        if status in _FINAL_STATUSES:
+            _terminal_cache[invocation_arn] = response
         logger.info(f"Status: {status}")
-        logger.info("\nFull response:")
-        logger.info(json.dumps(response, indent=2, default=str))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full response: %s", orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS).decode())
         return response
     except Exception as e:
         logger.error(f"Error checking job status: {e}")
         return None
 
-def list_job_statuses(max_results=10, status_filter="InProgress"):
+# A short TTL on the job listing lets several status queries in a row share
+# one paginated fetch instead of issuing a filtered request per status.
+_JOBS_TTL_SECONDS = 5.0
+_jobs_cache = (0.0, None)
+
+async def _list_jobs_by_status():
+    """Fetch all jobs in one paginated listing, bucketed by status"""
+    global _jobs_cache
+    fetched_at, buckets = _jobs_cache
+    if buckets is not None and time.monotonic() - fetched_at < _JOBS_TTL_SECONDS:
+        return buckets
+
+    buckets = defaultdict(list)
+    async with session.client("bedrock-runtime") as bedrock_runtime:
+        paginator = bedrock_runtime.get_paginator("list_async_invokes")
+        async for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
+            for job in page.get("asyncInvokeSummaries", []):
+                buckets[job["status"]].append(job)
+
+    _jobs_cache = (time.monotonic(), buckets)
+    return buckets
+
+async def list_job_statuses(max_results=10, status_filter="InProgress"):
     """List all video generation jobs with optional filtering"""
-    bedrock_runtime = boto3.client("bedrock-runtime")
     try:
-        invocation = bedrock_runtime.list_async_invokes(
-            maxResults=max_results,
-            statusEquals=status_filter,
-        )
-        
-        logger.info("Invocation Jobs:")
-        logger.info(json.dumps(invocation, indent=2, default=str))
-        return invocation
+        buckets = await _list_jobs_by_status()
+        jobs = buckets.get(status_filter, [])[:max_results]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Invocation Jobs: %s", orjson.dumps(jobs, option=orjson.OPT_NON_STR_KEYS).decode())
+        return jobs
     except Exception as e:
         logger.error(f"Error listing jobs: {e}")
         return None
@@ -115,37 +191,43 @@ def monitor_recent_jobs(duration_hours=1):
     return amazon_video_util.monitor_and_download_videos("output", submit_time_after=from_submit_time)
 
 
-def main():
-    # Initialize the AWS session
-    setup_aws_session()
-
+async def main():
     # Configuration
     S3_BUCKET = "nova-videos"  # Change this to your unique bucket name
     VIDEO_PROMPT = "Closeup of a large seashell in the sand, gentle waves flow around the shell. Camera zoom in."
     MODEL_ID = "amazon.nova-reel-v1:0"
 
-    # Generate video
-    invocation_arn = generate_video(S3_BUCKET, VIDEO_PROMPT, MODEL_ID)
+    # Initialize the AWS session and make sure the bucket exists
+    setup_aws_session(s3_destination_bucket=S3_BUCKET)
+
+    # Generate video. To submit several prompts concurrently, use
+    # asyncio.gather(*[generate_video(S3_BUCKET, p) for p in prompts]).
+    invocation_arn = await generate_video(S3_BUCKET, VIDEO_PROMPT, MODEL_ID)
     if not invocation_arn:
         logger.error("Failed to start video generation")
         exit(1)
 
     # Check initial status
     logger.info("\nChecking initial job status...")
-    check_job_status(invocation_arn)
+    await check_job_status(invocation_arn)
 
     # List all in-progress jobs
     logger.info("\nListing all in-progress jobs...")
-    list_job_statuses()
+    await list_job_statuses()
 
-    # Monitor and download the video
+    # Monitor and download the video. The helper is synchronous, so run it in
+    # a worker thread to keep the event loop free.
     logger.info("\nMonitoring job and waiting for completion...")
-    local_file_path = amazon_video_util.monitor_and_download_video(invocation_arn, "output")
+    local_file_path = await asyncio.to_thread(
+        amazon_video_util.monitor_and_download_video, invocation_arn, "output"
+    )
 
     if local_file_path:
         logger.info(f"\nVideo successfully generated and downloaded to: {local_file_path}")
     else:
         logger.info("\nFailed to generate or download video")
 
+    await _http_client.aclose()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+import hashlib
+import logging
+import orjson
+import boto3
+import amazon_video_util
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_ID = "amazon.nova-reel-v1:0"
+
+# Tuned away from botocore's defaults (60s timeouts, 10-connection pool,
+# legacy retries): a pool of 64 avoids "Connection pool is full" warnings
+# when submissions fan out across threads, tighter timeouts surface stalled
+# connections quickly, and adaptive retries back off under throttling.
+_config = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    connect_timeout=5,
+    read_timeout=30,
+    tcp_keepalive=True,
+)
+
+
+class VideoGenerator:
+    """
+    Reusable video-generation session for a destination bucket.
+
+    Client construction, session defaults, and the bucket-existence check all
+    happen once in the constructor, so each subsequent submission is just the
+    start_async_invoke round-trip. boto3 clients are thread-safe for method
+    calls, which lets submit_many share them across a thread pool.
+    """
+
+    def __init__(self, s3_destination_bucket, region="us-east-1", model_id=DEFAULT_MODEL_ID):
+        """
+        Args:
+            s3_destination_bucket (str): The S3 bucket where videos will be stored
+            region (str): The AWS region to use (default is "us-east-1")
+            model_id (str): The model ID to use for video generation (default is DEFAULT_MODEL_ID)
+        """
+        boto3.setup_default_session(region_name=region)
+        self.s3_destination_bucket = s3_destination_bucket
+        self.model_id = model_id
+        self._s3 = boto3.client("s3", config=_config)
+        self._bedrock = boto3.client("bedrock-runtime", config=_config)
+        # Prefer referencing input images by S3 URI; flipped off on the
+        # first submission the service rejects, after which images go
+        # inline as base64.
+        self._use_s3_image_source = True
+        amazon_video_util.ensure_bucket(self._s3, s3_destination_bucket)
+
+    def _upload_input_image(self, input_image_path):
+        """
+        Upload the input image once, keyed by content hash, and return its
+        S3 URI. Repeat submissions (and retries) of the same image reuse the
+        existing object instead of re-encoding and re-sending megabytes of
+        base64 in every request body.
+
+        Args:
+            input_image_path (str): Path to the input image
+
+        Returns:
+            str: The s3:// URI of the uploaded image.
+        """
+        with open(input_image_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:16]
+        key = f"inputs/{digest}.png"
+        try:
+            self._s3.head_object(Bucket=self.s3_destination_bucket, Key=key)
+        except ClientError:
+            self._s3.upload_file(input_image_path, self.s3_destination_bucket, key)
+        return f"s3://{self.s3_destination_bucket}/{key}"
+
+    def submit(self, video_prompt, input_image_path=None):
+        """
+        Start a video generation job for the prompt, optionally conditioned
+        on an input image.
+
+        Args:
+            video_prompt (str): Text prompt describing the desired video
+            input_image_path (str): Optional path to the input image (must be 1280 x 720)
+
+        Returns:
+            str: The invocation ARN, or None if the submission failed.
+        """
+        if input_image_path and self._use_s3_image_source:
+            model_input = amazon_video_util.build_model_input(
+                video_prompt,
+                input_image_uri=self._upload_input_image(input_image_path),
+            )
+        else:
+            model_input = amazon_video_util.build_model_input(
+                video_prompt, input_image_path
+            )
+
+        try:
+            # Start the asynchronous video generation job
+            invocation = self._bedrock.start_async_invoke(
+                modelId=self.model_id,
+                modelInput=model_input,
+                outputDataConfig={
+                    "s3OutputDataConfig": {"s3Uri": f"s3://{self.s3_destination_bucket}"}
+                },
+            )
+
+            invocation_arn = invocation["invocationArn"]
+
+            # Serialize the response only when the log level actually emits it
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response: %s", orjson.dumps(invocation, option=orjson.OPT_NON_STR_KEYS).decode())
+
+            # Save the invocation details for later reference
+            amazon_video_util.save_invocation_info(invocation, model_input)
+
+            return invocation_arn
+
+        except ClientError as e:
+            # Not every model version accepts S3-referenced input images; if
+            # the request shape is rejected, fall back to inline base64 for
+            # this and all later submissions.
+            if (
+                input_image_path
+                and self._use_s3_image_source
+                and e.response["Error"]["Code"] == "ValidationException"
+            ):
+                logger.info(
+                    "S3-referenced input images not supported; falling back to inline base64."
+                )
+                self._use_s3_image_source = False
+                return self.submit(video_prompt, input_image_path)
+            logger.error(e)
+            return None
+        except Exception as e:
+            logger.error(e)
+            return None
+
+    def submit_many(self, video_prompts):
+        """
+        Submit several independent video prompts concurrently.
+
+        Only segments that continue from a previous video's last frame have a
+        true data dependency; sibling prompts can all be fired at once,
+        cutting submission latency from N round-trips to roughly one.
+
+        Args:
+            video_prompts (list): Text prompts, one per independent video
+
+        Returns:
+            list: The invocation ARNs, in the same order as the prompts.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(self.submit, video_prompts))
+
+    def monitor_and_download(self, invocation_arn, output_folder="output"):
+        """
+        Wait for the job to finish and download the resulting video.
+
+        Args:
+            invocation_arn (str): The ARN of the invocation
+            output_folder (str): The folder where the video will be downloaded
+
+        Returns:
+            str: Local file path for the downloaded video.
+        """
+        return amazon_video_util.monitor_and_download_video(invocation_arn, output_folder)
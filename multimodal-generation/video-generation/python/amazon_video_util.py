@@ -1,16 +1,352 @@
+import asyncio
+import base64
+import functools
+import mmap
 import os
+import tempfile
 import time
+import aioboto3
 import boto3
 import json
 import logging
+import orjson
 import cv2
+import ffmpeg
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from moviepy import VideoFileClip, CompositeVideoClip
+from moviepy import VideoFileClip, concatenate_videoclips
 
 logger = logging.getLogger(__name__)
 
-bedrock_runtime = boto3.client("bedrock-runtime")
-s3_client = boto3.client("s3")
+# Downloads are independent network transfers and botocore releases the GIL
+# inside its socket reads, so fanning a batch out across threads makes it
+# bandwidth-bound instead of paying one round-trip per file in sequence.
+# One module-level pool serves every batch; threads spin up once per
+# process instead of once per monitoring call.
+_DOWNLOAD_WORKERS = 20
+_executor = ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS)
+
+# Tuned away from botocore's defaults (60s timeouts, 10-connection pool,
+# legacy retries): the larger pool keeps concurrent downloads from queueing
+# on connections, tighter timeouts surface stalled connections quickly, and
+# adaptive retries back off under throttling.
+_config = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    connect_timeout=5,
+    read_timeout=30,
+    tcp_keepalive=True,
+)
+
+# Large MP4s download as concurrent byte-range parts rather than one
+# serial stream — the same behavior the AWS CLI gets from s3transfer.
+_transfer_config = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(service_name: str):
+    """
+    Return a cached boto3 client for the given service.
+
+    Client construction parses service models and resolves endpoints and
+    credentials — tens of milliseconds that status-polling loops would
+    otherwise pay on every call. Clients are thread-safe for method calls,
+    so one per service per process is enough, and creating them lazily
+    means importing this module costs nothing.
+
+    Args:
+        service_name (str): The boto3 service name, e.g. "bedrock-runtime".
+
+    Returns:
+        The shared client for the service.
+    """
+    return boto3.client(service_name, config=_config)
+
+
+# How long a fetched job status stays fresh. Several helpers poll the same
+# ARN in quick succession; a short TTL collapses those bursts into a single
+# control-plane call without returning meaningfully stale data for jobs
+# that run for minutes.
+_STATUS_TTL_SECONDS = 2.0
+_status_cache: dict = {}
+
+# Terminal statuses never change, so once a job reports one every later
+# lookup can be answered locally — downstream helpers re-check finished
+# jobs freely without burning an API call each time.
+_FINAL_STATUSES = {"Completed", "Failed", "Stopped"}
+_terminal_cache: dict = {}
+
+
+def get_job_status(invocation_arn: str) -> dict:
+    """
+    Fetch the job details for an invocation ARN with a short TTL cache.
+
+    Args:
+        invocation_arn (str): The ARN of the invocation.
+
+    Returns:
+        dict: The get_async_invoke response for the ARN.
+    """
+    terminal = _terminal_cache.get(invocation_arn)
+    if terminal is not None:
+        return terminal
+
+    cached = _status_cache.get(invocation_arn)
+    now = time.monotonic()
+    if cached and now - cached[0] < _STATUS_TTL_SECONDS:
+        return cached[1]
+
+    response = get_client("bedrock-runtime").get_async_invoke(
+        invocationArn=invocation_arn
+    )
+    if response["status"] in _FINAL_STATUSES:
+        _terminal_cache[invocation_arn] = response
+    _status_cache[invocation_arn] = (now, response)
+    return response
+
+
+# Invariant portion of every model input, built once at import. Per-call
+# inputs merge this template instead of re-evaluating the nested dict
+# literal on each submission.
+_BASE_VIDEO_CONFIG = {
+    "durationSeconds": 6,  # 6 is the only supported value currently
+    "fps": 24,  # 24 is the only supported value currently
+    "dimension": "1280x720",  # "1280x720" is the only supported value currently
+}
+
+
+def build_model_input(
+    video_prompt: str, input_image_path: str = None, input_image_uri: str = None
+) -> dict:
+    """
+    Build the model input for a video generation job, optionally conditioned
+    on an input image. Shared by every submission path so the scripts don't
+    each carry their own copy of this structure.
+
+    Args:
+        video_prompt (str): Text prompt describing the desired video.
+        input_image_path (str, optional): Path to the input image (must be 1280 x 720).
+        input_image_uri (str, optional): S3 URI of an already-uploaded input
+            image; takes precedence over input_image_path and keeps the
+            request body to a few hundred bytes instead of megabytes of
+            inline base64.
+
+    Returns:
+        dict: The model input ready to pass to start_async_invoke.
+    """
+    model_input = {
+        "taskType": "TEXT_VIDEO",
+        "textToVideoParams": {
+            "text": video_prompt,
+        },
+        "videoGenerationConfig": {
+            **_BASE_VIDEO_CONFIG,
+            # A random seed guarantees a different result each run. Reading
+            # the OS entropy pool directly sidesteps the random module's
+            # shared lock on the concurrent submission path.
+            "seed": int.from_bytes(os.urandom(4), "big") & 0x7FFFFFFF,
+        },
+    }
+
+    if input_image_uri:
+        model_input["textToVideoParams"]["images"] = [
+            {
+                "format": "png",  # May be "png" or "jpeg"
+                "source": {"s3Location": {"uri": input_image_uri}},
+            }
+        ]
+    elif input_image_path:
+        # Encoding straight from a memory map skips the intermediate
+        # raw-bytes copy, and base64 output is pure ASCII.
+        with open(input_image_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                input_image_base64 = base64.b64encode(mm).decode("ascii")
+        model_input["textToVideoParams"]["images"] = [
+            {
+                "format": "png",  # May be "png" or "jpeg"
+                "source": {
+                    "bytes": input_image_base64
+                }
+            }
+        ]
+
+    return model_input
+
+
+def ensure_bucket(s3, bucket_name: str):
+    """
+    Make sure the destination bucket exists, creating it only when missing.
+
+    A head_bucket check is a single cheap round-trip and avoids the error
+    path create_bucket takes when the bucket already exists. Call this once
+    at session setup instead of creating the bucket on every submission.
+
+    Args:
+        s3: The S3 client to use.
+        bucket_name (str): The name of the bucket to check or create.
+    """
+    try:
+        s3.head_bucket(Bucket=bucket_name)
+        logger.info(f"Using existing bucket: {bucket_name}")
+    except ClientError:
+        logger.info(f"Creating bucket: {bucket_name}")
+        s3.create_bucket(Bucket=bucket_name)
+        s3.get_waiter("bucket_exists").wait(
+            Bucket=bucket_name, WaiterConfig={"Delay": 1, "MaxAttempts": 10}
+        )
+
+
+# Bedrock writes the finished video to the destination bucket, so an S3
+# ObjectCreated notification is a completion signal that costs no API calls
+# while waiting. When a queue has been configured the monitor helpers block
+# on a 20-second SQS long-poll instead of sleeping between status polls.
+_completion_queue_url = None
+
+
+def setup_completion_notifications(bucket_name: str, queue_name: str = "nova-video-completions"):
+    """
+    Route the bucket's ObjectCreated events to an SQS queue, creating the
+    queue if needed. One-time, idempotent setup; after it runs, the monitor
+    helpers switch from polling get_async_invoke to draining the queue.
+
+    Args:
+        bucket_name (str): The destination bucket to watch.
+        queue_name (str, optional): Name of the SQS queue to create or reuse.
+
+    Returns:
+        str: The URL of the notification queue, or None if setup failed and
+        the monitors will fall back to polling.
+    """
+    global _completion_queue_url
+    try:
+        sqs = get_client("sqs")
+        queue_url = sqs.create_queue(QueueName=queue_name)["QueueUrl"]
+        queue_arn = sqs.get_queue_attributes(
+            QueueUrl=queue_url, AttributeNames=["QueueArn"]
+        )["Attributes"]["QueueArn"]
+
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Principal": {"Service": "s3.amazonaws.com"},
+                    "Action": "sqs:SendMessage",
+                    "Resource": queue_arn,
+                    "Condition": {
+                        "ArnLike": {"aws:SourceArn": f"arn:aws:s3:::{bucket_name}"}
+                    },
+                }
+            ],
+        }
+        sqs.set_queue_attributes(
+            QueueUrl=queue_url, Attributes={"Policy": json.dumps(policy)}
+        )
+
+        s3 = get_client("s3")
+        # Merge with whatever is already configured on the bucket — a bare
+        # put replaces the existing configuration and would silently detach
+        # any other event consumers.
+        existing = s3.get_bucket_notification_configuration(Bucket=bucket_name)
+        notification_config = {
+            key: existing[key]
+            for key in (
+                "TopicConfigurations",
+                "QueueConfigurations",
+                "LambdaFunctionConfigurations",
+                "EventBridgeConfiguration",
+            )
+            if key in existing
+        }
+        queue_configs = [
+            config
+            for config in notification_config.get("QueueConfigurations", [])
+            if config.get("QueueArn") != queue_arn
+        ]
+        queue_configs.append(
+            {"QueueArn": queue_arn, "Events": ["s3:ObjectCreated:*"]}
+        )
+        notification_config["QueueConfigurations"] = queue_configs
+
+        s3.put_bucket_notification_configuration(
+            Bucket=bucket_name, NotificationConfiguration=notification_config
+        )
+    except Exception as e:
+        # Event-driven completion needs sqs:CreateQueue/SetQueueAttributes
+        # and s3:PutBucketNotification; without them the monitors simply
+        # keep polling, so setup failures are never fatal.
+        logger.warning(
+            f"Could not set up completion notifications ({e}); falling back to polling."
+        )
+        _completion_queue_url = None
+        return None
+
+    _completion_queue_url = queue_url
+    logger.info(f"Completion notifications routed to queue: {queue_url}")
+    return queue_url
+
+
+def wait_for_completion(invocation_arn: str, timeout_seconds: int = 60):
+    """
+    Block until the job's output object lands in S3, then return its status.
+
+    Drains the notification queue with long-polls until a created object key
+    matches the invocation, or the timeout passes — either way the status API
+    is consulted once at the end, so a missed or foreign event never produces
+    a wrong answer, it just degrades to one extra poll.
+
+    Args:
+        invocation_arn (str): The ARN of the invocation.
+        timeout_seconds (int, optional): How long to drain before re-polling.
+
+    Returns:
+        dict: The get_async_invoke response for the ARN.
+    """
+    invocation_id = get_job_id_from_arn(invocation_arn)
+    if _completion_queue_url is not None:
+        sqs = get_client("sqs")
+        deadline = time.monotonic() + timeout_seconds
+        matched = False
+        while not matched and time.monotonic() < deadline:
+            received = sqs.receive_message(
+                QueueUrl=_completion_queue_url,
+                MaxNumberOfMessages=10,
+                WaitTimeSeconds=20,
+            )
+            for message in received.get("Messages", []):
+                body = json.loads(message["Body"])
+                for record in body.get("Records", []):
+                    if invocation_id in record["s3"]["object"]["key"]:
+                        matched = True
+                sqs.delete_message(
+                    QueueUrl=_completion_queue_url,
+                    ReceiptHandle=message["ReceiptHandle"],
+                )
+
+    return get_job_status(invocation_arn)
+
+
+def _write_json(obj: dict, path: str):
+    """
+    Serialize obj to path with orjson.
+
+    orjson's C encoder is several times faster than stdlib json for nested
+    dicts and handles datetimes natively, so default=str only fires for the
+    rare value neither encoder knows.
+
+    Args:
+        obj (dict): The object to serialize.
+        path (str): The file path to write to.
+    """
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str))
 
 
 def save_invocation_info(
@@ -29,26 +365,48 @@ def save_invocation_info(
     """
     invocation_arn = invocation_result["invocationArn"]
     logger.info(f"Getting async invoke details for ARN: {invocation_arn}")
-    invocation_job = bedrock_runtime.get_async_invoke(invocationArn=invocation_arn)
+    invocation_job = get_job_status(invocation_arn)
     folder_name = get_folder_name_for_job(invocation_job)
 
     output_folder_abs = os.path.abspath(f"{output_folder}/{folder_name}")
     os.makedirs(output_folder_abs, exist_ok=True)
     logger.info(f"Saving invocation info to folder: {output_folder_abs}")
 
-    with open(
-        os.path.join(output_folder_abs, "start_async_invoke_response.json"), "w"
-    ) as f:
-        json.dump(invocation_result, f, indent=2, default=str)
-        logger.info("Saved start_async_invoke_response.json")
+    _write_json(
+        invocation_result,
+        os.path.join(output_folder_abs, "start_async_invoke_response.json"),
+    )
+    logger.info("Saved start_async_invoke_response.json")
 
-    with open(os.path.join(output_folder_abs, "model_input.json"), "w") as f:
-        json.dump(model_input, f, indent=2, default=str)
-        logger.info("Saved model_input.json")
+    _write_json(model_input, os.path.join(output_folder_abs, "model_input.json"))
+    logger.info("Saved model_input.json")
 
     return output_folder_abs
 
 
+@functools.lru_cache(maxsize=1024)
+def _folder_name_for_arn(invocation_arn: str, submit_iso: str) -> str:
+    """
+    Compute the folder name for a job, memoized per ARN.
+
+    Every save path asks for the same name several times over a job's life;
+    keying the cache on the ARN plus the ISO submit time (hashable, unlike
+    the job dict) turns the repeated astimezone/strftime work into a dict
+    lookup.
+
+    Args:
+        invocation_arn (str): The invocation ARN.
+        submit_iso (str): The submission time in ISO format.
+
+    Returns:
+        str: The generated folder name.
+    """
+    invocation_id = invocation_arn.split("/")[-1]
+    submit_time = datetime.fromisoformat(submit_iso)
+    timestamp = submit_time.astimezone().strftime("%Y-%m-%d_%H-%M-%S")
+    return f"{timestamp}_{invocation_id}"
+
+
 def get_folder_name_for_job(invocation_job: dict) -> str:
     """
     Generate a folder name for the job based on the invocation ARN and submission time.
@@ -59,17 +417,15 @@ def get_folder_name_for_job(invocation_job: dict) -> str:
     Returns:
         str: The generated folder name.
     """
-    invocation_arn = invocation_job["invocationArn"]
-    invocation_id = invocation_arn.split("/")[-1]
-    submit_time = invocation_job["submitTime"]
-    timestamp = submit_time.astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-    folder_name = f"{timestamp}_{invocation_id}"
+    folder_name = _folder_name_for_arn(
+        invocation_job["invocationArn"], invocation_job["submitTime"].isoformat()
+    )
     logger.info(f"Generated folder name: {folder_name}")
     return folder_name
 
 
 def is_video_downloaded_for_invocation_job(
-    invocation_job: dict, output_folder: str = "output"
+    invocation_job: dict, output_folder: str = "output", output_folder_abs: str = None
 ) -> bool:
     """
     Check if the video file for the given invocation job has been downloaded.
@@ -77,14 +433,16 @@ def is_video_downloaded_for_invocation_job(
     Args:
         invocation_job (dict): The job details containing the invocation ARN.
         output_folder (str, optional): The folder where the video is expected to be downloaded. Defaults to "output".
+        output_folder_abs (str, optional): The job's resolved output folder, if the caller already computed it.
 
     Returns:
         bool: True if the video file exists, False otherwise.
     """
     invocation_arn = invocation_job["invocationArn"]
     invocation_id = invocation_arn.split("/")[-1]
-    folder_name = get_folder_name_for_job(invocation_job)
-    output_folder_abs = os.path.abspath(f"{output_folder}/{folder_name}")
+    if output_folder_abs is None:
+        folder_name = get_folder_name_for_job(invocation_job)
+        output_folder_abs = os.path.abspath(f"{output_folder}/{folder_name}")
     file_name = f"{invocation_id}.mp4"
     video_path = os.path.join(output_folder_abs, file_name)
     if os.path.exists(video_path):
@@ -94,6 +452,11 @@ def is_video_downloaded_for_invocation_job(
     return False
 
 
+# The key Bedrock writes the video under, relative to the invocation-id
+# prefix. Updated from the listing fallback if a job ever uses another name.
+_output_key_suffix = "output.mp4"
+
+
 def download_video_for_invocation_arn(
     invocation_arn: str, bucket_name: str, destination_folder: str
 ):
@@ -108,6 +471,7 @@ def download_video_for_invocation_arn(
     Returns:
         str: Local file path for the downloaded video.
     """
+    global _output_key_suffix
     invocation_id = invocation_arn.split("/")[-1]
     file_name = f"{invocation_id}.mp4"
     output_folder_abs = os.path.abspath(destination_folder)
@@ -115,14 +479,42 @@ def download_video_for_invocation_arn(
     local_file_path = os.path.join(output_folder_abs, file_name)
     logger.info(f"Downloading video file to: {local_file_path}")
 
-    response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=invocation_id)
+    s3 = get_client("s3")
 
-    for obj in response.get("Contents", []):
-        object_key = obj["Key"]
-        if object_key.endswith(".mp4"):
-            s3_client.download_file(bucket_name, object_key, local_file_path)
-            logger.info(f"Downloaded video file: {local_file_path}")
-            return local_file_path
+    # The output key is predictable, so go straight for it and save the
+    # list round-trip; only a miss falls back to listing the prefix.
+    try:
+        s3.download_file(
+            bucket_name,
+            f"{invocation_id}/{_output_key_suffix}",
+            local_file_path,
+            Config=_transfer_config,
+        )
+        logger.info(f"Downloaded video file: {local_file_path}")
+        return local_file_path
+    except ClientError:
+        pass
+
+    # Paginate rather than trusting the prefix to hold fewer than 1000
+    # objects, and stop at the first MP4 instead of draining the listing.
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=invocation_id,
+        PaginationConfig={"PageSize": 1000},
+    ):
+        for obj in page.get("Contents", []):
+            object_key = obj["Key"]
+            if object_key.endswith(".mp4"):
+                if "/" in object_key:
+                    # Remember the suffix that actually exists so later jobs
+                    # skip the probe-then-list dance entirely.
+                    _output_key_suffix = object_key.split("/", 1)[1]
+                s3.download_file(
+                    bucket_name, object_key, local_file_path, Config=_transfer_config
+                )
+                logger.info(f"Downloaded video file: {local_file_path}")
+                return local_file_path
 
     logger.error(
         f"Problem: No MP4 file was found in S3 at {bucket_name}/{invocation_id}"
@@ -176,7 +568,7 @@ def monitor_and_download_video(invocation_arn: str, output_folder: str = "output
         str: Local file path for the downloaded video.
     """
     logger.info(f"Monitoring and downloading video for ARN: {invocation_arn}")
-    invocation_job = bedrock_runtime.get_async_invoke(invocationArn=invocation_arn)
+    invocation_job = get_job_status(invocation_arn)
     status = invocation_job["status"]
 
     if status == "Completed":
@@ -209,13 +601,21 @@ def monitor_and_download_in_progress_video(
     logger.info(
         f"Monitoring and downloading in-progress video for ARN: {invocation_arn}"
     )
-    job_update = bedrock_runtime.get_async_invoke(invocationArn=invocation_arn)
+    job_update = get_job_status(invocation_arn)
     status = job_update["status"]
 
+    # Back off between polls: short jobs are caught within a second or two
+    # instead of waiting out a fixed 10s tick, while long jobs settle at the
+    # 30s cap and burn far fewer API calls.
+    delay = 1.0
     while status == "InProgress":
         log_job_progress(job_update)
-        time.sleep(10)
-        job_update = bedrock_runtime.get_async_invoke(invocationArn=invocation_arn)
+        if _completion_queue_url is not None:
+            job_update = wait_for_completion(invocation_arn)
+        else:
+            time.sleep(delay)
+            delay = min(delay * 1.5, 30.0)
+            job_update = get_job_status(invocation_arn)
         status = job_update["status"]
 
     if status == "Completed":
@@ -242,7 +642,7 @@ def monitor_and_download_videos(
     if submit_time_after:
         failed_jobs_args["submitTimeAfter"] = submit_time_after
 
-    failed_jobs = bedrock_runtime.list_async_invokes(**failed_jobs_args)
+    failed_jobs = get_client("bedrock-runtime").list_async_invokes(**failed_jobs_args)
     for job in failed_jobs["asyncInvokeSummaries"]:
         save_failed_job(job, output_folder=output_folder)
 
@@ -250,9 +650,13 @@ def monitor_and_download_videos(
     if submit_time_after:
         completed_jobs_args["submitTimeAfter"] = submit_time_after
 
-    completed_jobs = bedrock_runtime.list_async_invokes(**completed_jobs_args)
-    for job in completed_jobs["asyncInvokeSummaries"]:
-        save_completed_job(job, output_folder=output_folder)
+    completed_jobs = get_client("bedrock-runtime").list_async_invokes(**completed_jobs_args)
+    list(
+        _executor.map(
+            lambda job: save_completed_job(job, output_folder=output_folder),
+            completed_jobs["asyncInvokeSummaries"],
+        )
+    )
 
     monitor_and_download_in_progress_videos(output_folder=output_folder)
 
@@ -265,31 +669,71 @@ def monitor_and_download_in_progress_videos(output_folder: str = "output"):
         output_folder (str, optional): The folder where the videos will be downloaded. Defaults to "output".
     """
     logger.info("Monitoring and downloading in-progress videos")
-    invocation_list = bedrock_runtime.list_async_invokes(statusEquals="InProgress")
+    invocation_list = get_client("bedrock-runtime").list_async_invokes(statusEquals="InProgress")
     in_progress_jobs = invocation_list["asyncInvokeSummaries"]
-    pending_job_arns = [job["invocationArn"] for job in in_progress_jobs]
+    # A set rather than a list: duplicate ARNs in the listing collapse to
+    # one poll each, and membership updates stay O(1) per job.
+    pending_job_arns = {job["invocationArn"] for job in in_progress_jobs}
+
+    asyncio.run(_monitor_pending_jobs(pending_job_arns, output_folder))
+
+    logger.info("Monitoring and download complete!")
+
+
+async def _monitor_pending_jobs(pending_job_arns: set, output_folder: str):
+    """
+    Poll all pending ARNs concurrently until every job reaches a terminal
+    state.
 
-    while pending_job_arns:
-        job_arns_to_remove = []
-        for job_arn in pending_job_arns:
-            job_update = bedrock_runtime.get_async_invoke(invocationArn=job_arn)
-            status = job_update["status"]
+    One shared aioboto3 client fans the get_async_invoke calls out with
+    asyncio.gather, so each polling cycle costs roughly one round-trip
+    regardless of job count. Jobs that finish in the same sweep are saved in
+    worker threads, keeping disk and S3 transfers off the event loop.
 
-            if status in ("Completed", "Failed"):
+    Args:
+        pending_job_arns (set): ARNs of the jobs still in progress.
+        output_folder (str): The folder where the videos will be downloaded.
+    """
+    session = aioboto3.Session()
+    delay = 1.0
+    async with session.client("bedrock-runtime", config=_config) as bedrock_runtime:
+        while pending_job_arns:
+            job_updates = await asyncio.gather(
+                *[
+                    bedrock_runtime.get_async_invoke(invocationArn=job_arn)
+                    for job_arn in pending_job_arns
+                ]
+            )
+
+            save_tasks = []
+            still_pending = set()
+            for job_update in job_updates:
+                status = job_update["status"]
                 if status == "Completed":
-                    save_completed_job(job_update, output_folder=output_folder)
+                    save_tasks.append(
+                        asyncio.to_thread(
+                            save_completed_job, job_update, output_folder=output_folder
+                        )
+                    )
+                elif status == "Failed":
+                    save_tasks.append(
+                        asyncio.to_thread(
+                            save_failed_job, job_update, output_folder=output_folder
+                        )
+                    )
                 else:
-                    save_failed_job(job_update, output_folder=output_folder)
-                job_arns_to_remove.append(job_arn)
-            else:
-                log_job_progress(job_update)
-
-        for job_arn in job_arns_to_remove:
-            pending_job_arns.remove(job_arn)
+                    log_job_progress(job_update)
+                    still_pending.add(job_update["invocationArn"])
 
-        time.sleep(10)
+            if save_tasks:
+                await asyncio.gather(*save_tasks)
 
-    logger.info("Monitoring and download complete!")
+            pending_job_arns = still_pending
+            # Grow the delay toward the cap while nothing changes; reset it
+            # when a job finishes so the remainder is re-checked promptly.
+            delay = 1.0 if save_tasks else min(delay * 1.5, 30.0)
+            if pending_job_arns:
+                await asyncio.sleep(delay)
 
 
 def get_job_id_from_arn(invocation_arn: str) -> str:
@@ -325,7 +769,9 @@ def save_completed_job(job: dict, output_folder: str = "output"):
 
     status_file = os.path.join(output_folder_abs, "completed.json")
 
-    if is_video_downloaded_for_invocation_job(job, output_folder=output_folder):
+    if is_video_downloaded_for_invocation_job(
+        job, output_folder=output_folder, output_folder_abs=output_folder_abs
+    ):
         logger.info(f"Skipping completed job {job_id}, video already downloaded.")
         return
 
@@ -338,9 +784,8 @@ def save_completed_job(job: dict, output_folder: str = "output"):
         job["invocationArn"], s3_bucket_name, output_folder_abs
     )
 
-    with open(status_file, "w") as f:
-        json.dump(job, f, indent=2, default=str)
-        logger.info(f"Saved completed job details to {status_file}")
+    _write_json(job, status_file)
+    logger.info(f"Saved completed job details to {status_file}")
 
     return local_file_path
 
@@ -366,9 +811,8 @@ def save_failed_job(job: dict, output_folder: str = "output"):
 
     os.makedirs(output_folder_abs, exist_ok=True)
 
-    with open(output_file, "w") as f:
-        json.dump(job, f, indent=2, default=str)
-        logger.info(f"Saved failed job details to {output_file}")
+    _write_json(job, output_file)
+    logger.info(f"Saved failed job details to {output_file}")
 
 
 def extract_last_frame(video_path: str, output_path: str):
@@ -379,6 +823,23 @@ def extract_last_frame(video_path: str, output_path: str):
         video_path (str): The local path to the video to extract the last frame from.
         output_path (str): The local path to save the extracted frame to.
     """
+    # Seek from the end of the file and decode only the final fraction of a
+    # second — constant cost, where OpenCV's frame-count seek can scan from
+    # the previous keyframe and scale with video length. update=1 keeps
+    # overwriting the output image until EOF, so the file ends up holding
+    # the true last frame rather than the first frame after the seek point.
+    try:
+        (
+            ffmpeg.input(video_path, sseof=-0.1)
+            .output(output_path, update=1)
+            .overwrite_output()
+            .run(quiet=True)
+        )
+        logger.info(f"Last frame saved as {output_path}")
+        return
+    except ffmpeg.Error:
+        logger.warning("ffmpeg could not extract the last frame; falling back to OpenCV.")
+
     # Open the video file
     cap = cv2.VideoCapture(video_path)
 
@@ -417,17 +878,49 @@ def stitch_videos(video1_path: str, video2_path: str, output_path: str):
         video2_path (str): The file path to the second video.
         output_path (str): The file path to save the stitched video.
     """
+    # When both inputs share codec and resolution — always true for segments
+    # produced by the same model — ffmpeg can concatenate at the container
+    # level with a stream copy, without decoding or re-encoding a single
+    # frame.
+    try:
+        streams = [
+            next(
+                s
+                for s in ffmpeg.probe(path)["streams"]
+                if s["codec_type"] == "video"
+            )
+            for path in (video1_path, video2_path)
+        ]
+        if all(
+            streams[0].get(key) == streams[1].get(key)
+            for key in ("codec_name", "width", "height", "pix_fmt")
+        ):
+            with tempfile.NamedTemporaryFile(
+                "w", suffix=".txt", delete=False
+            ) as listing:
+                listing.write(f"file '{os.path.abspath(video1_path)}'\n")
+                listing.write(f"file '{os.path.abspath(video2_path)}'\n")
+            try:
+                (
+                    ffmpeg.input(listing.name, format="concat", safe=0)
+                    .output(output_path, c="copy")
+                    .overwrite_output()
+                    .run(quiet=True)
+                )
+            finally:
+                os.unlink(listing.name)
+            logger.info(f"Stitched video saved to {output_path}")
+            return
+        logger.info("Video streams differ; re-encoding with moviepy.")
+    except ffmpeg.Error:
+        logger.warning("Stream copy failed; re-encoding with moviepy.")
+
     # Load the video clips
     clip1 = VideoFileClip(video1_path)
     clip2 = VideoFileClip(video2_path)
 
-    final_clip = [
-        clip1,
-        clip2.with_start(clip1.duration),
-    ]
-
     # Concatenate the clips
-    final_clip = CompositeVideoClip(final_clip)
+    final_clip = concatenate_videoclips([clip1, clip2], method="compose")
 
     # Write the result
     final_clip.write_videofile(output_path)
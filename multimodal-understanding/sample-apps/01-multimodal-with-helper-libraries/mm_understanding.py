@@ -1,4 +1,3 @@
-import base64
 import boto3
 import os
 import streamlit as st
@@ -27,6 +26,19 @@ models = [
 
 video_input_models = ["us.amazon.nova-lite-v1:0", "us.amazon.nova-pro-v1:0"]
 
+
+@st.cache_resource
+def _bedrock_client():
+    # Client construction resolves endpoints and credentials — tens of
+    # milliseconds that would otherwise be paid on every message.
+    return boto3.client("bedrock-runtime")
+
+
+@st.cache_resource
+def _account_id():
+    # The account ID never changes; one STS round-trip per process.
+    return boto3.client("sts").get_caller_identity()["Account"]
+
 image_input_models = [
     "us.amazon.nova-lite-v1:0",
     "us.amazon.nova-pro-v1:0",
@@ -74,7 +86,6 @@ if uploaded_file is not None:
     else:
         media_extension = "jpeg"
 
-    base_64_encoded_data = base64.b64encode(data_bytes)
     media_input = data_bytes
 
 if "messages" not in st.session_state:
@@ -95,7 +106,8 @@ for msg in st.session_state.display_messages:
 
 
 if prompt := st.chat_input():
-    client = boto3.client("bedrock-runtime")
+    client = _bedrock_client()
+    user_render = None
     if is_video and media_input and len(st.session_state.messages) == 0:
 
         if model_id in video_input_models and not resample_all_video:
@@ -111,9 +123,7 @@ if prompt := st.chat_input():
                                 "source": {
                                     "s3Location": {
                                         "uri": media_input_s3,
-                                        "bucketOwner": boto3.client("sts")
-                                        .get_caller_identity()
-                                        .get("Account"),
+                                        "bucketOwner": _account_id(),
                                     }
                                 },
                             }
@@ -138,6 +148,9 @@ if prompt := st.chat_input():
             )
             duration, frame_count, fps = utils.get_video_info(media_input)
 
+            # Only append to display_messages; the rendering loop at the top
+            # draws the captions, so the strings are formatted once instead
+            # of being rendered inline here and again on the next rerun.
             st.session_state.display_messages.append(
                 {
                     "type": "caption",
@@ -151,13 +164,6 @@ if prompt := st.chat_input():
                 }
             )
 
-            st.caption(
-                f"Duration: {duration} seconds. Frame Count: {frame_count}. {fps} FPS"
-            )
-            st.caption(
-                f"Sampled Frame Count: {utils.get_sampled_frame_count(duration)}. Sampled FPS: {utils.get_sampled_fps(duration)}. Token Count: {utils.get_sampled_tokens(duration)}"
-            )
-
         elif is_video and resample_all_video or model_id in image_input_models:
             video_as_frames = utils.resample_video_to_frames(media_input)
             frames_as_bytes = utils.convert_frames_to_converse_format(video_as_frames)
@@ -198,9 +204,7 @@ if prompt := st.chat_input():
                 }
             )
 
-        st.chat_message("user").video(media_input)
-
-        st.chat_message("user").write(prompt)
+        user_render = "video"
     elif media_input and not is_video:  # Media is uploaded and it is an image
         st.session_state.messages.append(
             {
@@ -236,7 +240,7 @@ if prompt := st.chat_input():
         st.session_state.display_messages.append(
             {"role": "user", "content": [{"text": prompt}]}
         )
-        st.chat_message("user").write(prompt)
+        user_render = "text"
 
     inf_params = {
         "maxTokens": max_new_tokens,
@@ -244,14 +248,23 @@ if prompt := st.chat_input():
         "topP": top_p,
     }
 
-    response2 = client.converse_stream(
+    # Start the model call before painting the user's message so the wait
+    # for the first response byte overlaps the rendering below.
+    response_future = utils.converse_stream_async(
+        client,
         modelId=model_id,
         messages=st.session_state.messages,
         inferenceConfig=inf_params,
         system=[{"text": system_prompt}],
     )
 
-    stream = response2["stream"]
+    if user_render == "video":
+        st.chat_message("user").video(media_input)
+        st.chat_message("user").write(prompt)
+    elif user_render == "text":
+        st.chat_message("user").write(prompt)
+
+    stream = response_future.result()["stream"]
     usage = {}
     output = st.write_stream(utils.parse_stream_converse(stream, usage))
     msg = output
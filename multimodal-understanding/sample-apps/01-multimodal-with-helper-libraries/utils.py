@@ -1,14 +1,93 @@
+import bisect
+import functools
+import hashlib
+import io
 import json
 import boto3
 import cv2
 import os
 import ffmpeg
+import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+import tempfile
 import time
 
+from boto3.s3.transfer import TransferConfig
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Anything over the threshold uploads as concurrent 8 MB parts instead of
+# one serial stream, so large videos are bandwidth-bound rather than
+# round-trip-bound.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+)
+
+
+def _hash_media_bytes(b):
+    # Length plus head and tail blocks: still cheap for large files, but
+    # videos that share a prefix (the same recording truncated or
+    # re-trimmed) hash differently instead of colliding on each other's
+    # cached results.
+    digest = hashlib.sha256(len(b).to_bytes(8, "big"))
+    digest.update(b[: 1024 * 1024])
+    digest.update(b[-(1024 * 1024) :])
+    return digest.digest()
+
+
+# Streamlit re-runs the whole script on every widget change, so without
+# caching each chat keystroke would re-probe, re-resample, re-encode, and
+# re-upload the same video. Hashing only sampled blocks of the bytes keeps
+# the cache key cheap even for large files.
+_cache_data = st.cache_data(
+    show_spinner=False,
+    hash_funcs={bytes: _hash_media_bytes},
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _s3_client():
+    # One client per process so uploads reuse the same connection pool.
+    return boto3.client("s3")
+
+
+_converse_executor = ThreadPoolExecutor(max_workers=4)
+
+
+def converse_stream_async(client, **kwargs):
+    """Start converse_stream in a worker thread and return the Future.
+
+    The first-byte wait moves off the script thread so Streamlit keeps
+    painting, and comparing several models becomes a matter of submitting
+    one future per model and consuming them as each arrives.
+    """
+    return _converse_executor.submit(client.converse_stream, **kwargs)
+
+
+try:
+    # libjpeg-turbo's SIMD DCT and Huffman coding encode HD frames several
+    # times faster than stock libjpeg, and one reused TurboJPEG instance
+    # avoids per-call quality-table setup.
+    from turbojpeg import TJPF_BGR, TurboJPEG
+
+    _turbo_jpeg = TurboJPEG()
+
+    # Quality 95 matches cv2.imencode's default so the two paths produce
+    # equivalent images for the model.
+    def _encode_jpeg(frame):
+        return _turbo_jpeg.encode(frame, quality=95, pixel_format=TJPF_BGR)
+
+except ImportError:
+
+    _JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 95]
+
+    def _encode_jpeg(frame):
+        return cv2.imencode(".jpeg", frame, _JPEG_PARAMS)[1].tobytes()
+
+
 # columns are seconds, frames to sample, sample rate fps and token count
 # source: https://docs.aws.amazon.com/nova/latest/userguide/modalities-video.html#modalities-video-tokens
 seconds_samples_fps_tokens = np.array(
@@ -65,93 +144,132 @@ def parse_stream(stream, usage):
                 usage["usage"] = message["metadata"]["usage"]
 
 
+# The three sampled-value columns share the same x-axis, so one binary
+# search can interpolate all of them at once. Pre-split into plain tuples:
+# for a scalar lookup on eight rows, np.interp's argument parsing and array
+# allocation cost more than the interpolation itself.
+_XS = tuple(seconds_samples_fps_tokens[:, 0].tolist())
+_YS = tuple(tuple(row) for row in seconds_samples_fps_tokens[:, 1:].tolist())
+
+
+@functools.lru_cache(maxsize=128)
+def _interp_all(seconds):
+    """Interpolate (samples, fps, tokens) for a duration in a single pass.
+
+    The captions ask for all three values, twice per message; memoizing on
+    the seconds value means Streamlit reruns with the same video reduce six
+    np.interp calls to one cached tuple lookup.
+    """
+    idx = bisect.bisect_left(_XS, seconds)
+    if idx <= 0:
+        return _YS[0]
+    if idx >= len(_XS):
+        return _YS[-1]
+    t = (seconds - _XS[idx - 1]) / (_XS[idx] - _XS[idx - 1])
+    return tuple(a + (b - a) * t for a, b in zip(_YS[idx - 1], _YS[idx]))
+
+
 def get_sampled_frame_count(seconds):
-    return np.interp(
-        seconds, seconds_samples_fps_tokens[:, 0], seconds_samples_fps_tokens[:, 1]
-    )
+    return _interp_all(float(seconds))[0]
 
 
 def get_sampled_fps(seconds):
-    return np.interp(
-        seconds, seconds_samples_fps_tokens[:, 0], seconds_samples_fps_tokens[:, 2]
-    )
+    return _interp_all(float(seconds))[1]
 
 
 def get_sampled_tokens(seconds):
-    return np.interp(
-        seconds, seconds_samples_fps_tokens[:, 0], seconds_samples_fps_tokens[:, 3]
-    )
+    return _interp_all(float(seconds))[2]
 
 
+@_cache_data
 def get_video_info(video_bytes):
-    os.makedirs("./tmp", exist_ok=True)
-    with open("./tmp/temp.mp4", "wb") as outfile:
+    # A uniquely named temp file keeps concurrent Streamlit sessions from
+    # clobbering each other's videos.
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as outfile:
         outfile.write(video_bytes)
-    video = cv2.VideoCapture("./tmp/temp.mp4")
-    fps = video.get(cv2.CAP_PROP_FPS)
-    frame_count = video.get(cv2.CAP_PROP_FRAME_COUNT)
-    duration = frame_count / fps
+    try:
+        # ffprobe reads only the container metadata — no decoder or demuxer
+        # initialization the way a full cv2.VideoCapture pays for.
+        meta = ffmpeg.probe(outfile.name)
+        stream = next(s for s in meta["streams"] if s["codec_type"] == "video")
+        num, den = stream["avg_frame_rate"].split("/")
+        fps = float(num) / float(den)
+        frame_count = float(stream["nb_frames"])
+        duration = frame_count / fps
+    except (ffmpeg.Error, KeyError, StopIteration, ValueError, ZeroDivisionError):
+        # Some containers don't report nb_frames; count via cv2 instead.
+        video = cv2.VideoCapture(outfile.name)
+        fps = video.get(cv2.CAP_PROP_FPS)
+        frame_count = video.get(cv2.CAP_PROP_FRAME_COUNT)
+        duration = frame_count / fps
+        video.release()
+    finally:
+        os.unlink(outfile.name)
 
     return duration, frame_count, fps
 
 
-def parse_video_and_upload_to_s3(file_path, bucket_name):
+def parse_video_and_upload_to_s3(video_bytes, bucket_name):
     file_name = datetime.now().strftime("%Y-%m-%d-%H-%M-%S") + ".mp4"
 
-    s3 = boto3.resource("s3")
-    s3.Bucket(bucket_name).upload_file(file_path, file_name)
+    _s3_client().upload_fileobj(
+        io.BytesIO(video_bytes), bucket_name, file_name, Config=_TRANSFER_CONFIG
+    )
 
     return f"s3://{bucket_name}/{file_name}"
 
 
+@_cache_data
 def resize_video(
     video_bytes,
     bucket_name,
     width=480,
 ):
-    os.makedirs("./tmp", exist_ok=True)
-    with open("./tmp/temp.mp4", "wb") as outfile:
-        outfile.write(video_bytes)
-
-    ffmpeg.input("./tmp/temp.mp4").filter("scale", width, -1).output(
-        "./tmp/resized_temp.mp4"
-    ).run(overwrite_output=True)
+    # Pipe the bytes straight through ffmpeg: no temp files on disk, no
+    # read-back of the result, and nothing shared between concurrent
+    # sessions. The fragmented-MP4 flags let ffmpeg write to a non-seekable
+    # stdout pipe.
+    resized_bytes, _ = (
+        ffmpeg.input("pipe:")
+        .filter("scale", width, -1)
+        .output("pipe:", format="mp4", movflags="frag_keyframe+empty_moov")
+        .run(input=video_bytes, capture_stdout=True, quiet=True)
+    )
 
-    return parse_video_and_upload_to_s3("./tmp/resized_temp.mp4", bucket_name)
+    return parse_video_and_upload_to_s3(resized_bytes, bucket_name)
 
 
+@_cache_data
 def resample_video_to_frames(video_bytes):
-    os.makedirs("./tmp", exist_ok=True)
-    with open("./tmp/temp.mp4", "wb") as outfile:
+    # cv2 needs a seekable file; a uniquely named temp file keeps concurrent
+    # Streamlit sessions from clobbering each other's videos.
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as outfile:
         outfile.write(video_bytes)
-    video = cv2.VideoCapture("./tmp/temp.mp4")
-    frame_count = video.get(cv2.CAP_PROP_FRAME_COUNT)
+    video = cv2.VideoCapture(outfile.name)
+    frame_count = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
     fps_to_sample = 20  # Converse supports 20 images
 
-    interval = frame_count // fps_to_sample
-    success = 1
-    frame_count = 0
+    # Seek straight to each target frame instead of decoding the whole video
+    # and discarding most of it — about 20 decodes regardless of length, and
+    # the evenly spaced targets can never overshoot the 20-image limit.
+    target_frames = np.linspace(0, max(frame_count - 1, 0), fps_to_sample).astype(int)
 
     frames = []
-
-    # read frames until no more
-    while success:
+    for target in target_frames:
+        video.set(cv2.CAP_PROP_POS_FRAMES, int(target))
         success, image = video.read()
-        if frame_count / interval == frame_count // interval:
+        if success:
             frames.append(image)
-        frame_count += 1
-
-    # ensure we are at max frame count
-    while len(frames) > 20:
-        frames.pop(-1)
+    video.release()
+    os.unlink(outfile.name)
 
     return frames
 
 
+@_cache_data
 def convert_frames_to_converse_format(frames):
-    converse_data = []
-
-    for frame in frames:
-        converse_data.append(cv2.imencode(".jpeg", frame)[1].tobytes())
-
-    return converse_data
+    # The JPEG encoders release the GIL, so the frames compress in parallel
+    # across a small thread pool instead of one Python-level loop iteration
+    # per frame.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(_encode_jpeg, frames))
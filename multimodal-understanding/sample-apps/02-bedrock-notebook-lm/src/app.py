@@ -3,19 +3,11 @@ main.py
 """
 
 # Standard library imports
-import base64
-import glob
-import os
-import random
-import time
-from pathlib import Path
-from tempfile import NamedTemporaryFile
+import asyncio
 from typing import List, Optional, Tuple
 
 # Third-party imports
 import gradio as gr
-from pydub import AudioSegment
-from pypdf import PdfReader
 
 # Local imports
 from constants import (
@@ -48,11 +40,10 @@ from utils import (
     parse_url,
     read_pdfs,
     list_foundation_models,
-    video_to_base64_string,
 )
 
 
-def generate_podcast(
+async def generate_podcast(
     model_name: str,
     video_files: List[str],
     files: List[str],
@@ -61,6 +52,7 @@ def generate_podcast(
     question: Optional[str],
     tone: Optional[str],
     length: Optional[str],
+    refine: bool = False,
     # language: str,
 ) -> Tuple[str, str]:
     """Generate the audio and transcript from the PDFs and/or URL."""
@@ -75,22 +67,48 @@ def generate_podcast(
     if not files and not url and not s3_url and not video_files:
         raise gr.Error(ERROR_MESSAGE_NO_INPUT)
 
+    # The three sources are independent network/CPU tasks, so fetch them
+    # concurrently: wall-clock becomes the slowest source rather than the
+    # sum of all three. Results are collected in a fixed order so the
+    # combined text stays deterministic.
+    # Each source stops reading once it has passed the character budget
+    # (one extra character so overflow is still detectable), and the limit
+    # check runs as each result lands instead of after all the work is done.
+    # The blocking helpers run in worker threads so the server's event loop
+    # keeps serving other sessions while this one ingests.
+    budget = CHARACTER_LIMIT + 1
+    pdf_task = (
+        asyncio.create_task(asyncio.to_thread(read_pdfs, files, budget))
+        if files
+        else None
+    )
+    url_task = (
+        asyncio.create_task(asyncio.to_thread(parse_url, url, budget)) if url else None
+    )
+    s3_task = (
+        asyncio.create_task(asyncio.to_thread(get_pdf_from_s3, s3_url, budget))
+        if s3_url
+        else None
+    )
+
     # Process PDFs if any
-    if files:
-        text += read_pdfs(files)
+    if pdf_task:
+        text += await pdf_task
+        if len(text) > CHARACTER_LIMIT:
+            raise gr.Error(ERROR_MESSAGE_TOO_LONG)
 
     # Process URL if provided
-    if url:
+    if url_task:
         try:
-            url_text = parse_url(url)
-            text += "\n\n" + url_text
+            text += "\n\n" + await url_task
         except ValueError as e:
             raise gr.Error(str(e))
+        if len(text) > CHARACTER_LIMIT:
+            raise gr.Error(ERROR_MESSAGE_TOO_LONG)
 
-    if s3_url:
+    if s3_task:
         try:
-            s3_text = get_pdf_from_s3(s3_url)
-            text += "\n\n" + s3_text
+            text += "\n\n" + await s3_task
         except ValueError as e:
             raise gr.Error(str(e))
 
@@ -113,21 +131,27 @@ def generate_podcast(
     text = f"<text>\n{text}</text>\n" + OUTPUT_FORMAT_MODIFIER
 
     # Call the LLM
-    if length == "Short (1-2 min)":
-        llm_output = generate_script(
-            model_id, modified_system_prompt, text, video_files, ShortDialogue
-        )
-    else:
-        llm_output = generate_script(
-            model_id, modified_system_prompt, text, video_files, MediumDialogue
-        )
+    dialogue_format = (
+        ShortDialogue if length == "Short (1-2 min)" else MediumDialogue
+    )
+    llm_output = await asyncio.to_thread(
+        generate_script,
+        model_id,
+        modified_system_prompt,
+        text,
+        video_files,
+        dialogue_format,
+        refine,
+    )
 
     # Process the dialogue
     transcript = "\n\n".join(
         [item.speaker + ": " + item.text for item in llm_output.dialogue]
     )
 
-    create_dialogue_audio(llm_output.dialogue, "dialogue_output.mp3")
+    await asyncio.to_thread(
+        create_dialogue_audio, llm_output.dialogue, "dialogue_output.mp3"
+    )
 
     return "dialogue_output.mp3", transcript
 
@@ -176,6 +200,10 @@ demo = gr.Interface(
             choices=UI_INPUTS["length"]["choices"],
             value=UI_INPUTS["length"]["value"],
         ),
+        gr.Checkbox(
+            label=UI_INPUTS["refine"]["label"],  # Step 6: Refinement pass
+            value=UI_INPUTS["refine"]["value"],
+        ),
         # gr.Dropdown(
         #     choices=UI_INPUTS["language"]["choices"],  # Step 6: Language
         #     value=UI_INPUTS["language"]["value"],
@@ -191,9 +219,17 @@ demo = gr.Interface(
     allow_flagging=UI_ALLOW_FLAGGING,
     api_name=UI_API_NAME,
     # theme=gr.themes.Ocean(),
-    concurrency_limit=UI_CONCURRENCY_LIMIT,
     cache_examples=UI_CACHE_EXAMPLES,
 )
 
+# Explicit queue configuration: bound how many requests run at once and
+# how many can wait, and close the open API path so direct calls also go
+# through the queue.
+demo.queue(
+    default_concurrency_limit=UI_CONCURRENCY_LIMIT,
+    max_size=32,
+    api_open=False,
+)
+
 if __name__ == "__main__":
     demo.launch(show_api=UI_SHOW_API, server_name="0.0.0.0")
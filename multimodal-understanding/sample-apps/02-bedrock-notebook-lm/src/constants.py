@@ -2,6 +2,7 @@
 constants.py
 """
 
+import os
 from pathlib import Path
 
 # Key constants
@@ -87,6 +88,10 @@ UI_INPUTS = {
         "choices": ["Short (1-2 min)", "Medium (3-5 min)"],
         "value": "Medium (3-5 min)",
     },
+    "refine": {
+        "label": " ✨ Refine the dialogue with a second pass? (slower)",
+        "value": False,
+    },
     "models": {
         "label": " 🤖 Choose the model",
         "choices": [],
@@ -138,3 +143,7 @@ UI_EXAMPLES = [
 UI_CACHE_EXAMPLES = False
 UI_SHOW_API = True
 AWS_REGION = "us-east-1"
+
+# When set, uploaded videos are staged in this bucket and passed to Bedrock
+# as s3:// references instead of inline base64 bytes.
+VIDEO_UPLOAD_S3_BUCKET = os.environ.get("VIDEO_UPLOAD_S3_BUCKET", "")